@@ -17,16 +17,84 @@ Features:
 """
 
 import os
+import io
 import sys
 import time
 import csv
+import mmap
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
-from datetime import datetime
+
+try:
+    import curses
+except ImportError:  # e.g. Windows without windows-curses
+    curses = None
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # Configuration
 DEFAULT_RESULTS_DIR = 'results'
 REFRESH_INTERVAL = 2  # seconds
 MAX_DISPLAY_ROUNDS = 20
+METRIC_COLUMNS = ('round', 'accuracy', 'reward')  # numeric columns read per agent
+
+# Display layout
+HEAVY_RULE = "=" * 90
+LIGHT_RULE = "-" * 90
+RECENT_ROUNDS = 5
+HISTORY_ENTRY = 'R{}:{:.3f}'.format  # one round of the recent-history line
+TABLE_HEADER = (f"{'Agent':<10} {'Round':<8} {'Latest Acc':<12} {'Mean Acc':<12} "
+                f"{'Best Acc':<12} {'Latest Reward':<15}")
+
+def _parse_float(value):
+    """Convert a CSV field to float, mapping blanks and junk to NaN."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+def _column_stats_numpy(arr):
+    """Return (count, mean, std, min, max) of the non-NaN values in arr."""
+    arr = arr[~np.isnan(arr)]
+    if arr.size == 0:
+        return 0, 0.0, 0.0, 0.0, 0.0
+    return arr.size, arr.mean(), arr.std(), arr.min(), arr.max()
+
+
+if njit is not None:
+    # fastmath is left off: it lets LLVM assume there are no NaNs, and
+    # blank CSV fields are stored as NaN
+    @njit(cache=True)
+    def _column_stats(arr):
+        """Single-pass (Welford) version of _column_stats_numpy."""
+        n = 0
+        mean = 0.0
+        m2 = 0.0
+        mn = np.inf
+        mx = -np.inf
+        for x in arr:
+            if np.isnan(x):
+                continue
+            n += 1
+            delta = x - mean
+            mean += delta / n
+            m2 += delta * (x - mean)
+            mn = min(mn, x)
+            mx = max(mx, x)
+        if n == 0:
+            return 0, 0.0, 0.0, 0.0, 0.0
+        return n, mean, np.sqrt(m2 / n), mn, mx
+    
+    _column_stats(np.zeros(1))  # compile (or load from cache) up front
+else:
+    _column_stats = _column_stats_numpy
+
 
 class TrainingMonitor:
     """
@@ -57,43 +125,199 @@ class TrainingMonitor:
         
         self.summary_file = self.results_dir / 'summary.csv'
         
+        # Incremental read state per agent: byte offset of the last complete
+        # line consumed, mtime at that point, CSV header, indices of the
+        # metric columns and their float64 arrays
+        self._cache = {agent: self._empty_cache() for agent in self.metric_files}
+        
         self.start_time = time.time()
         self.iteration = 0
+        
+        # (epoch second, formatted time, elapsed minutes, elapsed seconds)
+        self._time_cache = (0, '', 0, 0)
+        
+        # Lines of the frame being built, as (text, style) pairs
+        self._frame = []
+        
+        # Row templates for the progress table, built once
+        self._row_fmt = ("{agent:<10} {round:<8} {accuracy:<12.4f} {mean_acc:<12.4f} "
+                         "{best_acc:<12.4f} {reward:<15.4f}").format
+        self._na_row_fmt = ("{agent:<10} " + f"{'N/A':<8} {'N/A':<12} {'N/A':<12} "
+                            f"{'N/A':<12} {'N/A':<15}").format
+        
+        # Metric files are parsed on worker threads (one per agent) so a slow
+        # parse cannot stall the display; _snapshot holds the latest results
+        self._pool = ThreadPoolExecutor(max_workers=len(self.metric_files))
+        self._pending = {}
+        self._snapshot = {}
+        
+        # Last load error per agent, shown in the frame rather than printed
+        # from a worker thread while curses owns the screen
+        self._load_errors = {}
     
-    def check_files_exist(self):
-        """Check which metric files are available."""
+    def scan_results_dir(self):
+        """
+        List the results directory once.
+        
+        Returns:
+            Dictionary mapping file name to os.DirEntry, so existence checks
+            and stat() calls for the tick reuse this single listing
+        """
+        try:
+            with os.scandir(self.results_dir) as it:
+                return {entry.name: entry for entry in it if entry.is_file()}
+        except OSError:
+            return {}
+    
+    def check_files_exist(self, entries):
+        """Check which metric files are available in a directory listing."""
         available = {}
         for agent, filepath in self.metric_files.items():
-            available[agent] = filepath.exists()
+            available[agent] = filepath.name in entries
         return available
     
-    def load_metrics(self, agent_name):
+    @staticmethod
+    def _empty_cache():
+        """Return a fresh incremental-read cache entry."""
+        return {'offset': 0, 'mtime': 0, 'header': None, 'usecols': None,
+                'columns': None}
+    
+    def load_metrics(self, agent_name, entry=None):
         """
         Load metrics from CSV file for specific agent.
         
+        The file is memory-mapped and only rows appended since the previous
+        call are parsed (with np.loadtxt); earlier rows are served from the
+        per-agent cache. A file that shrinks (truncated or rewritten) is
+        re-read from the start.
+        
         Args:
             agent_name: Name of the agent (PPO, SAC, TD3, Random)
+            entry: Optional os.DirEntry for the file from scan_results_dir
             
         Returns:
-            List of dictionaries with metrics or None if file not found
+            Dictionary mapping column name (round, accuracy, reward) to a
+            float64 array, or None if the file is missing or has no rows
         """
         filepath = self.metric_files.get(agent_name)
+        if filepath is None:
+            return None
         
-        if filepath and filepath.exists():
-            try:
-                with open(filepath, 'r') as f:
-                    reader = csv.DictReader(f)
-                    data = list(reader)
-                    if len(data) > 0:
-                        return data
-            except Exception as e:
-                print(f"Error loading {agent_name}: {e}")
+        cached = self._cache[agent_name]
         
-        return None
+        try:
+            st = entry.stat() if entry is not None else os.stat(filepath)
+        except OSError:
+            return None
+        
+        if st.st_size < cached['offset']:
+            cached = self._cache[agent_name] = self._empty_cache()
+        elif st.st_mtime == cached['mtime'] and st.st_size == cached['offset']:
+            return cached['columns']
+        
+        try:
+            if st.st_size > 0:
+                with open(filepath, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    self._read_appended(cached, mm)
+            cached['mtime'] = st.st_mtime
+            self._load_errors.pop(agent_name, None)
+        except Exception as e:
+            self._load_errors[agent_name] = f"Error loading {agent_name}: {e}"
+        
+        return cached['columns']
+    
+    @staticmethod
+    def _read_appended(cached, mm):
+        """Parse complete lines after the cached offset of a mapped file."""
+        if cached['header'] is None:
+            header_end = mm.find(b'\n')
+            if header_end < 0:
+                return
+            header = mm[:header_end].decode('utf-8').strip().split(',')
+            cached['header'] = header
+            cached['usecols'] = [(name, header.index(name))
+                                 for name in METRIC_COLUMNS if name in header]
+            cached['offset'] = header_end + 1
+        
+        # Stop at the last newline so a half-written row is picked up on
+        # the next call instead of being parsed short
+        start = cached['offset']
+        end = mm.rfind(b'\n', start) + 1
+        if end <= start or not cached['usecols']:
+            return
+        
+        block = mm[start:end]
+        indices = [index for _, index in cached['usecols']]
+        try:
+            values = np.loadtxt(io.BytesIO(block), delimiter=',', dtype=np.float64,
+                                usecols=indices, ndmin=2)
+        except ValueError:
+            # Blank or non-numeric fields - parse this block field by field
+            records = [r for r in csv.reader(block.decode('utf-8').splitlines()) if r]
+            values = np.array([[_parse_float(r[i]) if i < len(r) else np.nan
+                                for i in indices] for r in records],
+                              dtype=np.float64).reshape(-1, len(indices))
+        
+        cached['offset'] = end
+        if len(values) == 0:
+            return
+        
+        # Build a new dict so readers on other threads never see a
+        # half-updated set of columns
+        old = cached['columns'] or {}
+        cached['columns'] = {
+            name: values[:, i] if name not in old
+            else np.concatenate([old[name], values[:, i]])
+            for i, (name, _) in enumerate(cached['usecols'])
+        }
     
-    def load_summary(self):
-        """Load summary statistics."""
-        if self.summary_file.exists():
+    def refresh_metrics(self, entries):
+        """
+        Reload every agent's metrics in parallel.
+        
+        Waits at most 90% of the refresh interval; agents whose load has not
+        finished keep their previous data and are collected on a later tick.
+        
+        Args:
+            entries: Directory listing from scan_results_dir
+        
+        Returns:
+            Snapshot dictionary mapping agent name to its metric columns
+            (or None), shared by all display passes of the tick
+        """
+        for agent, filepath in self.metric_files.items():
+            entry = entries.get(filepath.name)
+            future = self._pending.get(agent)
+            if entry is None:
+                if future is None or future.done():
+                    self._pending.pop(agent, None)
+                    self._snapshot[agent] = None
+            elif future is None or future.done():
+                self._pending[agent] = self._pool.submit(self.load_metrics, agent, entry)
+        
+        done, _ = wait(self._pending.values(), timeout=REFRESH_INTERVAL * 0.9)
+        
+        for agent, future in self._pending.items():
+            if future in done:
+                self._snapshot[agent] = future.result()
+        
+        return dict(self._snapshot)
+    
+    def load_summary(self, entries=None):
+        """
+        Load summary statistics.
+        
+        Args:
+            entries: Optional directory listing from scan_results_dir, used
+                instead of checking the file system
+        """
+        if entries is None:
+            exists = self.summary_file.exists()
+        else:
+            exists = self.summary_file.name in entries
+        
+        if exists:
             try:
                 with open(self.summary_file, 'r') as f:
                     reader = csv.DictReader(f)
@@ -103,111 +327,138 @@ class TrainingMonitor:
         return None
     
     def get_latest_metrics(self, data):
-        """Extract latest metrics from data list."""
-        if data is None or len(data) == 0:
-            return {'round': 0, 'accuracy': 0.0, 'reward': 0.0}
+        """Extract latest metrics from column data."""
+        defaults = {'round': 0, 'accuracy': 0.0, 'reward': 0.0}
+        if data is None:
+            return defaults
         
-        latest = data[-1]
-        return {
-            'round': int(float(latest.get('round', 0))),
-            'accuracy': float(latest.get('accuracy', 0.0)),
-            'reward': float(latest.get('reward', 0.0))
-        }
+        latest = {}
+        for name, default in defaults.items():
+            column = data.get(name)
+            if column is None or column.size == 0 or np.isnan(column[-1]):
+                latest[name] = default
+            else:
+                latest[name] = float(column[-1])
+        latest['round'] = int(latest['round'])
+        return latest
     
     def get_statistics(self, data, column='accuracy'):
-        """Calculate statistics for a column."""
-        if data is None or len(data) == 0:
+        """Calculate statistics for a column of metrics from load_metrics."""
+        if data is None or column not in data:
             return {'mean': 0.0, 'std': 0.0, 'max': 0.0, 'min': 0.0}
         
-        try:
-            values = [float(row[column]) for row in data if column in row and row[column]]
-            if len(values) == 0:
-                return {'mean': 0.0, 'std': 0.0, 'max': 0.0, 'min': 0.0}
-            
-            mean_val = sum(values) / len(values)
-            variance = sum((x - mean_val) ** 2 for x in values) / len(values)
-            std_val = variance ** 0.5
-            
-            return {
-                'mean': mean_val,
-                'std': std_val,
-                'max': max(values),
-                'min': min(values)
-            }
-        except:
+        count, mean, std, min_val, max_val = _column_stats(data[column])
+        
+        if count == 0:
             return {'mean': 0.0, 'std': 0.0, 'max': 0.0, 'min': 0.0}
+        
+        return {
+            'mean': float(mean),
+            'std': float(std),
+            'max': float(max_val),
+            'min': float(min_val)
+        }
+    
+    def _emit(self, text='', style=None):
+        """
+        Queue a line of output for the current frame.
+        
+        Args:
+            text: Line text; embedded newlines start additional lines
+            style: Optional style name ('rule', 'title', 'best', 'na')
+        """
+        for line in text.split('\n'):
+            self._frame.append((line, style))
     
     def display_header(self):
         """Display monitoring header."""
-        elapsed = time.time() - self.start_time
-        elapsed_min = int(elapsed // 60)
-        elapsed_sec = int(elapsed % 60)
+        # Clock text only changes once per second, so reuse it within a second
+        now = time.time()
+        if int(now) != self._time_cache[0]:
+            elapsed = now - self.start_time
+            self._time_cache = (int(now),
+                                time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)),
+                                int(elapsed // 60),
+                                int(elapsed % 60))
+        _, current_time, elapsed_min, elapsed_sec = self._time_cache
         
-        print("\033[H\033[J")  # Clear screen
-        print("=" * 90)
-        print(" " * 20 + "FEDERATED DRL TRAINING MONITOR")
-        print("=" * 90)
-        print(f"Results Directory: {self.results_dir}")
-        print(f"Monitor Runtime: {elapsed_min}m {elapsed_sec}s")
-        print(f"Current Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Refresh Rate: {REFRESH_INTERVAL}s")
-        print("=" * 90)
+        self._emit(HEAVY_RULE, 'rule')
+        self._emit(" " * 20 + "FEDERATED DRL TRAINING MONITOR", 'title')
+        self._emit(HEAVY_RULE, 'rule')
+        self._emit(f"Results Directory: {self.results_dir}")
+        self._emit(f"Monitor Runtime: {elapsed_min}m {elapsed_sec}s")
+        self._emit(f"Current Time: {current_time}")
+        self._emit(f"Refresh Rate: {REFRESH_INTERVAL}s")
+        self._emit(HEAVY_RULE, 'rule')
     
-    def display_training_progress(self):
-        """Display training progress for all agents."""
-        print("\nTRAINING PROGRESS")
-        print("-" * 90)
+    def display_training_progress(self, snapshot, entries):
+        """
+        Display training progress for all agents.
+        
+        Args:
+            snapshot: Per-agent metrics from refresh_metrics
+            entries: Directory listing from scan_results_dir
+        """
+        self._emit()
+        self._emit("TRAINING PROGRESS", 'title')
+        self._emit(LIGHT_RULE, 'rule')
         
-        available = self.check_files_exist()
+        available = self.check_files_exist(entries)
         
         if not any(available.values()):
-            print("No training data found. Waiting for training to start...")
+            self._emit("No training data found. Waiting for training to start...", 'na')
             return
         
         # Table header
-        print(f"{'Agent':<10} {'Round':<8} {'Latest Acc':<12} {'Mean Acc':<12} {'Best Acc':<12} {'Latest Reward':<15}")
-        print("-" * 90)
+        self._emit(TABLE_HEADER, 'title')
+        self._emit(LIGHT_RULE, 'rule')
         
-        all_metrics = {}
+        best_agent, best_acc = None, None
         
         for agent in ['PPO', 'SAC', 'TD3', 'Random']:
             if not available.get(agent, False):
-                print(f"{agent:<10} {'N/A':<8} {'N/A':<12} {'N/A':<12} {'N/A':<12} {'N/A':<15}")
+                self._emit(self._na_row_fmt(agent=agent), 'na')
                 continue
             
-            df = self.load_metrics(agent)
-            if df is None or len(df) == 0:
-                print(f"{agent:<10} {'N/A':<8} {'N/A':<12} {'N/A':<12} {'N/A':<12} {'N/A':<15}")
+            df = snapshot.get(agent)
+            if df is None:
+                self._emit(self._na_row_fmt(agent=agent), 'na')
                 continue
             
             latest = self.get_latest_metrics(df)
             stats = self.get_statistics(df, 'accuracy')
             
-            all_metrics[agent] = {'latest': latest, 'stats': stats}
+            if best_acc is None or latest['accuracy'] > best_acc:
+                best_agent, best_acc = agent, latest['accuracy']
             
-            print(f"{agent:<10} "
-                  f"{latest['round']:<8} "
-                  f"{latest['accuracy']:<12.4f} "
-                  f"{stats['mean']:<12.4f} "
-                  f"{stats['max']:<12.4f} "
-                  f"{latest['reward']:<15.4f}")
-        
-        # Find best performer
-        if all_metrics:
-            best_agent = max(all_metrics.keys(), 
-                           key=lambda x: all_metrics[x]['latest']['accuracy'])
-            print("\n" + "-" * 90)
-            print(f"Best Current Performance: {best_agent} "
-                  f"(Accuracy: {all_metrics[best_agent]['latest']['accuracy']:.4f})")
+            self._emit(self._row_fmt(agent=agent,
+                                     round=latest['round'],
+                                     accuracy=latest['accuracy'],
+                                     mean_acc=stats['mean'],
+                                     best_acc=stats['max'],
+                                     reward=latest['reward']))
+        
+        for agent in ['PPO', 'SAC', 'TD3', 'Random']:
+            error = self._load_errors.get(agent)
+            if error is not None:
+                self._emit(error, 'na')
+        
+        # Best performer (tracked while building the table)
+        if best_agent is not None:
+            self._emit()
+            self._emit(LIGHT_RULE, 'rule')
+            self._emit(f"Best Current Performance: {best_agent} "
+                       f"(Accuracy: {best_acc:.4f})", 'best')
     
-    def display_summary(self):
+    def display_summary(self, entries):
         """Display summary statistics if available."""
-        summary_data = self.load_summary()
+        summary_data = self.load_summary(entries)
         
         if summary_data is not None and len(summary_data) > 0:
-            print("\n" + "=" * 90)
-            print("FINAL SUMMARY STATISTICS")
-            print("-" * 90)
+            self._emit()
+            self._emit(HEAVY_RULE, 'rule')
+            self._emit("FINAL SUMMARY STATISTICS", 'title')
+            self._emit(LIGHT_RULE, 'rule')
             
             for row in summary_data:
                 agent = row.get('agent', 'Unknown')
@@ -216,36 +467,126 @@ class TrainingMonitor:
                 std_acc = float(row.get('std_accuracy', 0.0))
                 time_taken = float(row.get('training_time_seconds', 0.0))
                 
-                print(f"{agent:<10} "
-                      f"Final: {final_acc:.4f} | "
-                      f"Mean: {mean_acc:.4f} | "
-                      f"Std: {std_acc:.4f} | "
-                      f"Time: {time_taken:.1f}s")
+                self._emit(f"{agent:<10} "
+                           f"Final: {final_acc:.4f} | "
+                           f"Mean: {mean_acc:.4f} | "
+                           f"Std: {std_acc:.4f} | "
+                           f"Time: {time_taken:.1f}s")
     
-    def display_recent_history(self):
+    def display_recent_history(self, snapshot):
         """Display recent training history for all agents."""
-        print("\n" + "=" * 90)
-        print("RECENT ACCURACY HISTORY (Last 5 Rounds)")
-        print("-" * 90)
+        self._emit()
+        self._emit(HEAVY_RULE, 'rule')
+        self._emit(f"RECENT ACCURACY HISTORY (Last {RECENT_ROUNDS} Rounds)", 'title')
+        self._emit(LIGHT_RULE, 'rule')
         
         for agent in ['PPO', 'SAC', 'TD3', 'Random']:
-            data = self.load_metrics(agent)
+            data = snapshot.get(agent)
             
-            if data is None or len(data) == 0:
-                print(f"{agent:<10} No data available")
+            if data is None:
+                self._emit(f"{agent:<10} No data available", 'na')
                 continue
             
-            # Get last 5 rounds
-            recent = data[-5:] if len(data) >= 5 else data
-            
             try:
-                acc_str = ', '.join([
-                    f"R{int(float(row['round']))}:{float(row['accuracy']):.3f}" 
-                    for row in recent if 'round' in row and 'accuracy' in row
-                ])
-                print(f"{agent:<10} {acc_str}")
+                rounds = data['round'][-RECENT_ROUNDS:]
+                accuracies = data['accuracy'][-RECENT_ROUNDS:]
+                # Blank or junk rounds are parsed as NaN; skip those rows
+                valid = ~np.isnan(rounds)
+                if rounds.size and not valid.any():
+                    raise ValueError("no valid rounds")
+                rounds = rounds[valid].astype(np.int64)
+                accuracies = accuracies[valid]
+                acc_str = ', '.join(map(HISTORY_ENTRY, rounds.tolist(),
+                                        accuracies.tolist()))
+                self._emit(f"{agent:<10} {acc_str}")
             except:
-                print(f"{agent:<10} Data format error")
+                self._emit(f"{agent:<10} Data format error", 'na')
+    
+    def build_frame(self):
+        """Collect the lines for one refresh of the dashboard."""
+        self._frame = []
+        
+        # One directory listing and one metrics snapshot per tick, shared by
+        # every display pass
+        entries = self.scan_results_dir()
+        snapshot = self.refresh_metrics(entries)
+        
+        self.display_header()
+        self.display_training_progress(snapshot, entries)
+        self.display_recent_history(snapshot)
+        self.display_summary(entries)
+        
+        self._emit()
+        self._emit(HEAVY_RULE, 'rule')
+        self._emit(f"Refresh #{self.iteration} | Press Ctrl+C to exit")
+        self._emit(HEAVY_RULE, 'rule')
+        
+        return self._frame
+    
+    def _render_plain(self, frame):
+        """Clear the screen and print the whole frame (non-TTY fallback)."""
+        print("\033[H\033[J")  # Clear screen
+        print('\n'.join(text for text, _ in frame))
+    
+    def _init_curses(self, stdscr):
+        """Set up curses state and the style -> attribute table."""
+        try:
+            curses.curs_set(0)
+        except curses.error:
+            pass  # Terminal cannot hide the cursor (e.g. TERM=dumb)
+        self._attrs = {None: curses.A_NORMAL,
+                       'rule': curses.A_BOLD,
+                       'title': curses.A_BOLD,
+                       'best': curses.A_BOLD,
+                       'na': curses.A_DIM}
+        
+        if curses.has_colors():
+            curses.start_color()
+            curses.use_default_colors()
+            curses.init_pair(1, curses.COLOR_GREEN, -1)
+            curses.init_pair(2, curses.COLOR_YELLOW, -1)
+            self._attrs['best'] = curses.color_pair(1) | curses.A_BOLD
+            self._attrs['na'] = curses.color_pair(2)
+        
+        self._prev_cells = {}
+        self._screen_size = stdscr.getmaxyx()
+    
+    def _render_curses(self, stdscr, frame):
+        """Redraw only the rows whose text or style changed since last frame."""
+        size = stdscr.getmaxyx()
+        if size != self._screen_size:
+            # Terminal resized - everything on screen is stale
+            self._screen_size = size
+            self._prev_cells.clear()
+            stdscr.clear()
+        height, width = size
+        
+        for row, cell in enumerate(frame[:height]):
+            if self._prev_cells.get((row, 0)) == cell:
+                continue
+            text, style = cell
+            stdscr.move(row, 0)
+            stdscr.clrtoeol()
+            stdscr.addnstr(row, 0, text, width - 1, self._attrs[style])
+            self._prev_cells[(row, 0)] = cell
+        
+        # Blank out rows left over from a longer previous frame
+        for row, col in [key for key in self._prev_cells if key[0] >= len(frame)]:
+            stdscr.move(row, 0)
+            stdscr.clrtoeol()
+            del self._prev_cells[(row, col)]
+        
+        stdscr.noutrefresh()
+        curses.doupdate()
+    
+    def _run_curses(self, stdscr):
+        """Monitoring loop drawing through curses."""
+        self._init_curses(stdscr)
+        
+        while True:
+            self.iteration += 1
+            self._render_curses(stdscr, self.build_frame())
+            time.sleep(REFRESH_INTERVAL)
     
     def run(self):
         """Main monitoring loop."""
@@ -254,24 +595,25 @@ class TrainingMonitor:
         print(f"Press Ctrl+C to stop\n")
         
         try:
+            if curses is not None and sys.stdout.isatty():
+                try:
+                    curses.wrapper(self._run_curses)
+                except curses.error as e:
+                    # Unknown/unset TERM or a terminal curses cannot drive -
+                    # fall back to the plain print loop
+                    print(f"curses unavailable ({e}), using plain output")
+            
             while True:
                 self.iteration += 1
-                
-                self.display_header()
-                self.display_training_progress()
-                self.display_recent_history()
-                self.display_summary()
-                
-                print("\n" + "=" * 90)
-                print(f"Refresh #{self.iteration} | Press Ctrl+C to exit")
-                print("=" * 90)
-                
+                self._render_plain(self.build_frame())
                 time.sleep(REFRESH_INTERVAL)
                 
         except KeyboardInterrupt:
             print("\n\nMonitoring stopped by user")
             print(f"Total runtime: {int(time.time() - self.start_time)}s")
             print("Monitor terminated successfully")
+        finally:
+            self._pool.shutdown(wait=False)
 
 
 def main():
@@ -279,9 +621,9 @@ def main():
     # Get results directory from command line or use default
     results_dir = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_RESULTS_DIR
     
-    print("=" * 90)
+    print(HEAVY_RULE)
     print(" " * 25 + "TRAINING MONITOR v2.0")
-    print("=" * 90)
+    print(HEAVY_RULE)
     print()
     
     # Create and run monitor
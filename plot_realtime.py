@@ -11,6 +11,8 @@ Dependencies:
     - matplotlib
     - pandas
     - numpy
+    - pyarrow (optional, faster incremental CSV parsing and support for
+      metrics.arrow / actions.arrow IPC streams, preferred over the CSVs)
 
 Features:
     - Live reward curves (per client + global)
@@ -20,18 +22,337 @@ Features:
 """
 
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 from matplotlib.gridspec import GridSpec
 import pandas as pd
 import numpy as np
+import io
 import sys
 import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from datetime import datetime
+from typing import Dict, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
 
 # Configuration
-REFRESH_INTERVAL = 2000  # milliseconds
+REFRESH_INTERVAL = 200  # milliseconds between checks for changed files
 WINDOW_SIZE = 100  # Number of data points to show
+DECIMATE_THRESHOLD = WINDOW_SIZE * 10  # Series longer than this are decimated
+
+class GrowableArray:
+    """
+    Append-only 1-D NumPy buffer with doubling capacity.
+    
+    extend() is amortized O(len(values)) instead of the O(total) copy of
+    np.append. view() is a zero-copy slice of the filled part; later
+    appends never modify data inside a view already handed out.
+    """
+    
+    def __init__(self, dtype=np.float64, capacity=1024):
+        self.buf = np.empty(capacity, dtype=dtype)
+        self.n = 0
+    
+    def extend(self, values):
+        """Append values, promoting the dtype if needed (e.g. int -> float)"""
+        values = np.asarray(values)
+        need = self.n + len(values)
+        dtype = np.result_type(self.buf.dtype, values.dtype)
+        
+        if need > len(self.buf) or dtype != self.buf.dtype:
+            buf = np.empty(max(need, 2 * len(self.buf)), dtype=dtype)
+            buf[:self.n] = self.buf[:self.n]
+            self.buf = buf
+        
+        self.buf[self.n:need] = values
+        self.n = need
+    
+    def view(self):
+        """Filled part of the buffer (no copy)"""
+        return self.buf[:self.n]
+
+
+def decimate(x, y, n_buckets=WINDOW_SIZE):
+    """
+    Reduce a long series to about n_buckets points.
+    
+    Consecutive samples are grouped into n_buckets near-equal buckets; each
+    bucket contributes its first x value and the mean, min and max of y.
+    
+    Returns:
+        (x, mean, lower, upper) arrays, or None if the series is short
+        enough to plot as-is
+    """
+    n = len(y)
+    if n <= DECIMATE_THRESHOLD:
+        return None
+    
+    starts = np.arange(n_buckets) * n // n_buckets
+    counts = np.diff(np.append(starts, n))
+    y = np.asarray(y, dtype=np.float64)
+    
+    return (np.asarray(x)[starts],
+            np.add.reduceat(y, starts) / counts,
+            np.minimum.reduceat(y, starts),
+            np.maximum.reduceat(y, starts))
+
+
+def first_per_round(rounds, values):
+    """
+    First non-NaN value for each distinct round, in round order.
+    
+    NumPy equivalent of DataFrame.groupby('round')[col].first(); rounds
+    with no valid value get NaN.
+    
+    Returns:
+        (unique_rounds, values) arrays
+    """
+    unique_rounds = np.unique(rounds)
+    valid = ~np.isnan(values)
+    valid_rounds, first = np.unique(rounds[valid], return_index=True)
+    
+    result = np.full(len(unique_rounds), np.nan)
+    result[np.searchsorted(unique_rounds, valid_rounds)] = values[valid][first]
+    return unique_rounds, result
+
+
+def latest_round_values(client_rounds, client_values, latest_round):
+    """
+    Values logged for latest_round by every client, as one array.
+    
+    Clients log their rounds in order, so only the trailing rows of each
+    client's arrays are inspected rather than masking every row.
+    """
+    parts = []
+    for client_id, rounds in client_rounds.items():
+        start = len(rounds)
+        while start and rounds[start - 1] == latest_round:
+            start -= 1
+        if client_id in client_values:
+            parts.append(client_values[client_id][start:])
+    return np.concatenate(parts) if parts else np.empty(0)
+
+
+class MetricsSource:
+    """
+    Incremental reader for a metrics file that is only ever appended to.
+    
+    Each read_new() parses just the data written since the previous call
+    and returns those rows; unchanged files cost a single stat. Rows are
+    not retained - callers accumulate what they need. A file that shrinks
+    is treated as rewritten and re-read from the start (generation is
+    bumped). Subclasses implement _read_appended() for a particular file
+    format.
+    """
+    
+    def __init__(self, path, generation=0):
+        self.path = path
+        self.generation = generation - 1
+        self.reset()
+    
+    def reset(self):
+        """Forget the read position and start again from the beginning."""
+        # Bumped on every reset so consumers know to drop derived state
+        self.generation += 1
+        self.offset = 0
+        self.mtime = 0
+        self._schema = None
+    
+    def read_new(self):
+        """Return only the rows appended since the last read, or None."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        
+        if st.st_size < self.offset:
+            self.reset()
+        elif st.st_size == self.offset and st.st_mtime == self.mtime:
+            return None
+        
+        self.mtime = st.st_mtime
+        return self._read_appended()
+    
+    def _read_appended(self):
+        """Read data past self.offset, advance it and return the new rows."""
+        raise NotImplementedError
+
+
+class CSVTailReader(MetricsSource):
+    """
+    MetricsSource for CSV files.
+    
+    Only complete lines are consumed, so a half-written trailing row is
+    picked up by the next read. Parsing uses pyarrow when installed and
+    pandas otherwise.
+    """
+    
+    def reset(self):
+        super().reset()
+        self.names = None
+    
+    def _read_appended(self):
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            chunk = f.read()
+        
+        # Leave a half-written trailing row for the next read
+        end = chunk.rfind(b'\n') + 1
+        if end == 0:
+            return None
+        chunk = chunk[:end]
+        
+        names = self.names
+        if names is None:
+            header_end = chunk.index(b'\n') + 1
+            names = chunk[:header_end].decode('utf-8').strip().split(',')
+            chunk = chunk[header_end:]
+        
+        new = None
+        if chunk.strip():
+            try:
+                new = self._parse(chunk, names)
+            except (TypeError, ValueError):  # incl. ArrowTypeError/ArrowInvalid
+                if self.offset == 0:
+                    raise  # the whole file doesn't parse; retry next time
+                # The new rows don't fit the cached schema: re-read the whole
+                # file so the types are inferred across all rows
+                mtime = self.mtime
+                self.reset()
+                self.mtime = mtime
+                return self._read_appended()
+        
+        # Advance only once the block is parsed, so a failed read is retried
+        self.names = names
+        self.offset += end
+        return new
+    
+    def _parse(self, body, names):
+        """Parse a block of complete CSV lines and return it."""
+        if pa is None:
+            return pd.read_csv(io.BytesIO(body), names=names, header=None)
+        
+        read_options = pa_csv.ReadOptions(column_names=names, block_size=1 << 20)
+        
+        # Reuse the column types inferred so far to skip re-inference;
+        # all-empty columns are still untyped and left to the parser
+        column_types = {}
+        if self._schema is not None:
+            column_types = {field.name: field.type for field in self._schema
+                            if not pa.types.is_null(field.type)}
+        
+        try:
+            new = pa_csv.open_csv(
+                pa.BufferReader(body), read_options=read_options,
+                convert_options=pa_csv.ConvertOptions(column_types=column_types)
+            ).read_all()
+        except pa.ArrowInvalid:
+            # Type changed (e.g. ints that became floats) - infer afresh
+            new = pa_csv.open_csv(pa.BufferReader(body), read_options=read_options).read_all()
+        
+        # Only the merged schema is kept; it raises on incompatible types
+        if self._schema is None:
+            self._schema = new.schema
+        else:
+            self._schema = pa.unify_schemas([self._schema, new.schema],
+                                            promote_options='permissive')
+        return new.to_pandas()
+
+
+class ArrowStreamReader(MetricsSource):
+    """
+    MetricsSource for Arrow IPC stream files (e.g. metrics.arrow).
+    
+    Record batches arrive already typed, so nothing is parsed from text;
+    the byte offset advances one complete IPC message at a time and a
+    partially written message is retried on the next read.
+    """
+    
+    def _read_appended(self):
+        batches = []
+        with pa.OSFile(str(self.path)) as f:
+            f.seek(self.offset)
+            reader = pa.ipc.MessageReader.open_stream(f)
+            while True:
+                try:
+                    message = reader.read_next_message()
+                except StopIteration:  # end of data or end-of-stream marker
+                    break
+                except (pa.ArrowInvalid, OSError):  # message still being written
+                    break
+                
+                if message.type == 'schema':
+                    self._schema = pa.ipc.read_schema(message)
+                elif message.type == 'record batch':
+                    batches.append(pa.ipc.read_record_batch(message, self._schema))
+                self.offset = f.tell()
+        
+        if not batches:
+            return None
+        
+        return pa.Table.from_batches(batches, schema=self._schema).to_pandas()
+
+
+def metrics_source_paths(csv_path):
+    """Files open_metrics_source may read for csv_path (CSV first)."""
+    if pa is None:
+        return (csv_path,)
+    return (csv_path, csv_path.with_suffix('.arrow'))
+
+
+def open_metrics_source(csv_path, current=None):
+    """
+    Return the MetricsSource for a metrics file.
+    
+    An Arrow IPC stream next to the CSV (same name, .arrow suffix) is
+    preferred when pyarrow is available and it is at least as new as the
+    CSV, so a stream left over from an earlier run does not hide the live
+    CSV; otherwise the CSV is tailed. Called again on every refresh with
+    the reader in use as current, which is returned unchanged while it
+    still reads the preferred file; a replacement continues its
+    generation count so consumers drop the rows read so far.
+    """
+    path = csv_path
+    if pa is not None:
+        arrow_path = csv_path.with_suffix('.arrow')
+        try:
+            arrow_mtime = os.stat(arrow_path).st_mtime_ns
+        except OSError:
+            arrow_mtime = None
+        if arrow_mtime is not None:
+            try:
+                if arrow_mtime >= os.stat(csv_path).st_mtime_ns:
+                    path = arrow_path
+            except OSError:
+                path = arrow_path  # no CSV at all
+    
+    if current is not None and current.path == path:
+        return current
+    generation = 0 if current is None else current.generation + 1
+    if path == csv_path:
+        return CSVTailReader(path, generation)
+    return ArrowStreamReader(path, generation)
+
+
+@dataclass
+class MetricsSnapshot:
+    """Consistent view of the training data, built off the GUI thread"""
+    generation: int
+    latest_round: Optional[int]
+    actions: Optional[pd.Series]  # latest action-distribution row
+    client_rounds: Dict[int, np.ndarray]
+    client_rewards: Dict[int, np.ndarray]
+    client_eplen: Dict[int, np.ndarray]
+    client_loss: Dict[int, np.ndarray]
+    rounds_all: np.ndarray
+    global_reward_all: Optional[np.ndarray]
+
 
 class DRLTrainingPlotter:
     """Real-time plotter for DRL training metrics"""
@@ -41,6 +362,11 @@ class DRLTrainingPlotter:
         self.metrics_file = self.output_dir / 'metrics.csv'
         self.actions_file = self.output_dir / 'actions.csv'
         
+        # Incremental readers so each refresh only parses appended rows;
+        # the source is re-chosen on every read (see open_metrics_source)
+        self._metrics_reader = open_metrics_source(self.metrics_file)
+        self._actions_reader = open_metrics_source(self.actions_file)
+        
         # Check if directory exists
         if not self.output_dir.exists():
             print(f"Error: Directory '{output_dir}' not found")
@@ -61,145 +387,336 @@ class DRLTrainingPlotter:
         self.ax4 = self.fig.add_subplot(gs[2, 0])  # Action distribution
         self.ax5 = self.fig.add_subplot(gs[2, 1])  # Training statistics
         
-        # Initialize data storage
-        self.reward_data = {}
-        self.loss_data = {}
-        self.episode_data = {}
-        self.action_data = {}
+        # Per-client metric arrays (struct-of-arrays of GrowableArray),
+        # extended with each block of new rows so plotting needs no
+        # DataFrame filtering
+        self.client_rounds = {}
+        self.client_rewards = {}
+        self.client_eplen = {}
+        self.client_loss = {}
+        
+        # Round and global reward of every row, for the global reward line
+        self.rounds_all = GrowableArray()
+        self.global_reward_all = None
+        self.latest_round = None
+        self._metrics_generation = self._metrics_reader.generation
+        
+        # Only the newest action row is drawn, so only that one is kept
+        self._latest_actions = None
+        
+        # Latest snapshot from the reader thread (older ones are dropped)
+        self._snapshots = queue.Queue(maxsize=1)
+        
+        # Artists are created once and updated in place every frame
+        self._lines = {}
+        self._envelopes = {}  # min/max fills for decimated series, by line key
+        self._drawn_generation = self._metrics_generation
+        self._clock = (0, '')  # (epoch second, formatted time)
+        self._bars = None
+        self._bar_names = None
+        self._bar_labels = []
+        self._init_axes()
+        plt.tight_layout()
         
         print(f"✓ Monitoring: {self.output_dir}")
-        print(f"✓ Refresh interval: {REFRESH_INTERVAL/1000}s")
+        print(f"✓ Redraws on file change (checked every {REFRESH_INTERVAL/1000}s)")
         print("✓ Press Ctrl+C to stop")
     
     def read_metrics(self):
-        """Read latest metrics from CSV file"""
+        """Read newly appended metric rows into the per-client arrays"""
+        self._metrics_reader = open_metrics_source(self.metrics_file,
+                                                   self._metrics_reader)
         try:
-            if self.metrics_file.exists():
-                df = pd.read_csv(self.metrics_file)
-                return df
-            return None
+            new_rows = self._metrics_reader.read_new()
         except Exception as e:
             print(f"Warning: Error reading metrics: {e}")
-            return None
-    
-    def read_actions(self):
-        """Read action distribution data"""
-        try:
-            if self.actions_file.exists():
-                df = pd.read_csv(self.actions_file)
-                return df
-            return None
-        except Exception as e:
-            return None
-    
-    def update_plot(self, frame):
-        """Update all plots with latest data"""
+            return
         
-        # Read latest data
-        metrics_df = self.read_metrics()
-        actions_df = self.read_actions()
+        if self._metrics_reader.generation != self._metrics_generation:
+            # File was rewritten - rebuild the per-client arrays from scratch
+            self._metrics_generation = self._metrics_reader.generation
+            for store in (self.client_rounds, self.client_rewards,
+                          self.client_eplen, self.client_loss):
+                store.clear()
+            self.rounds_all = GrowableArray()
+            self.global_reward_all = None
+            self.latest_round = None
         
-        if metrics_df is None or len(metrics_df) == 0:
-            # No data yet - show waiting message
-            self.ax1.clear()
-            self.ax1.text(0.5, 0.5, 'Waiting for training data...', 
-                         ha='center', va='center', fontsize=14)
-            self.ax1.set_title('Reward Progression')
-            return
+        if new_rows is not None and len(new_rows) > 0:
+            self._append_client_rows(new_rows)
+    
+    def _append_client_rows(self, rows):
+        """Split a block of new metric rows by client and extend the arrays"""
+        client_ids = rows['client_id'].to_numpy()
+        rounds = rows['round'].to_numpy()
         
-        # --- Plot 1: Reward Curves ---
-        self.ax1.clear()
+        self.rounds_all.extend(rounds)
+        block_latest = rounds.max().item()
+        if self.latest_round is None or block_latest > self.latest_round:
+            self.latest_round = block_latest
+        if 'global_reward' in rows.columns:
+            if self.global_reward_all is None:
+                self.global_reward_all = GrowableArray()
+            self.global_reward_all.extend(rows['global_reward'].to_numpy(dtype=np.float64))
         
-        # Group by client
-        for client_id in metrics_df['client_id'].unique():
-            client_data = metrics_df[metrics_df['client_id'] == client_id]
-            self.ax1.plot(client_data['round'], client_data['mean_reward'], 
-                         marker='o', label=f'Client {client_id}', alpha=0.7)
+        columns = [(self.client_rewards, 'mean_reward'),
+                   (self.client_eplen, 'episode_length'),
+                   (self.client_loss, 'loss')]
+        columns = [(store, rows[name].to_numpy(dtype=np.float64))
+                   for store, name in columns if name in rows.columns]
         
-        # Plot global average if available
-        if 'global_reward' in metrics_df.columns:
-            global_data = metrics_df.groupby('round')['global_reward'].first()
-            self.ax1.plot(global_data.index, global_data.values, 
-                         linestyle='--', linewidth=3, color='black', 
-                         marker='s', label='Global', alpha=0.9)
+        for client_id in pd.unique(client_ids):
+            mask = client_ids == client_id
+            client_id = client_id.item()
+            
+            for store, values in [(self.client_rounds, rounds)] + columns:
+                if client_id not in store:
+                    store[client_id] = GrowableArray(values.dtype)
+                store[client_id].extend(values[mask])
+    
+    def read_actions(self):
+        """Read newly appended action rows and return the latest one"""
+        generation = self._actions_reader.generation
+        self._actions_reader = open_metrics_source(self.actions_file,
+                                                   self._actions_reader)
+        try:
+            new_rows = self._actions_reader.read_new()
+        except Exception:
+            return self._latest_actions
         
+        if self._actions_reader.generation != generation:
+            self._latest_actions = None  # file was rewritten
+        if new_rows is not None and len(new_rows) > 0:
+            self._latest_actions = new_rows.iloc[-1]
+        return self._latest_actions
+    
+    def _init_axes(self):
+        """Set titles, labels, grids and placeholder artists once"""
         self.ax1.set_xlabel('Round', fontweight='bold')
         self.ax1.set_ylabel('Mean Reward', fontweight='bold')
         self.ax1.set_title('Training Reward Progression', fontweight='bold')
-        self.ax1.legend(loc='best', fontsize=9)
         self.ax1.grid(True, alpha=0.3)
         
-        # --- Plot 2: Episode Lengths ---
-        self.ax2.clear()
+        self.ax2.set_xlabel('Round', fontweight='bold')
+        self.ax2.set_ylabel('Episode Length', fontweight='bold')
+        self.ax2.set_title('Episode Length Over Time', fontweight='bold')
+        self.ax2.grid(True, alpha=0.3)
         
-        if 'episode_length' in metrics_df.columns:
-            for client_id in metrics_df['client_id'].unique():
-                client_data = metrics_df[metrics_df['client_id'] == client_id]
-                self.ax2.plot(client_data['round'], client_data['episode_length'], 
-                             label=f'Client {client_id}', alpha=0.6)
+        self.ax3.set_xlabel('Round', fontweight='bold')
+        self.ax3.set_ylabel('Loss', fontweight='bold')
+        self.ax3.set_title('Training Loss', fontweight='bold')
+        self.ax3.grid(True, alpha=0.3)
+        self.ax3.set_yscale('log')  # Log scale for loss
+        
+        self.ax4.set_xlabel('Frequency', fontweight='bold')
+        self.ax4.set_title('Current Action Distribution', fontweight='bold')
+        self.ax4.grid(True, axis='x', alpha=0.3)
+        
+        self.ax5.axis('off')
+        
+        # Messages shown in place of missing data
+        self._placeholders = {
+            ax: ax.text(0.5, 0.5, message, ha='center', va='center',
+                        transform=ax.transAxes, **kwargs)
+            for ax, message, kwargs in [
+                (self.ax1, 'Waiting for training data...', {'fontsize': 14}),
+                (self.ax2, 'Episode data not available', {}),
+                (self.ax3, 'Loss data not available', {}),
+                (self.ax4, 'Action data not available', {}),
+            ]
+        }
+        
+        self._stats_text = self.ax5.text(
+            0.1, 0.95, '', transform=self.ax5.transAxes,
+            fontsize=10, verticalalignment='top',
+            fontfamily='monospace',
+            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.3))
+        self._stats_text.set_visible(False)
+    
+    def _set_line(self, ax, key, x, y, **style):
+        """
+        Update the cached line for key, creating it on first use.
+        
+        Returns True if a new line was added (so the legend needs rebuilding).
+        """
+        line = self._lines.get(key)
+        if line is None:
+            self._lines[key], = ax.plot(x, y, **style)
+            return True
+        line.set_data(x, y)
+        return False
+    
+    def _set_series(self, ax, key, x, y, **style):
+        """
+        Like _set_line, but long series are drawn as a decimated mean line
+        with a shaded min/max envelope so the vertex count stays bounded.
+        """
+        envelope = self._envelopes.pop(key, None)
+        if envelope is not None:
+            envelope.remove()
+        
+        reduced = decimate(x, y)
+        if reduced is None:
+            return self._set_line(ax, key, x, y, **style)
+        
+        x, mean, lower, upper = reduced
+        new_line = self._set_line(ax, key, x, mean, **style)
+        self._envelopes[key] = ax.fill_between(
+            x, lower, upper, color=self._lines[key].get_color(),
+            alpha=0.15, linewidth=0)
+        return new_line
+    
+    def _clear_lines(self):
+        """Remove all cached line and envelope artists"""
+        for artist in list(self._lines.values()) + list(self._envelopes.values()):
+            artist.remove()
+        self._lines.clear()
+        self._envelopes.clear()
+    
+    def _update_bars(self, names, values):
+        """Update the action distribution bars, rebuilding only if actions change"""
+        if self._bars is None or self._bar_names != names:
+            if self._bars is not None:
+                self._bars.remove()
+                for label in self._bar_labels:
+                    label.remove()
             
-            self.ax2.set_xlabel('Round', fontweight='bold')
-            self.ax2.set_ylabel('Episode Length', fontweight='bold')
-            self.ax2.set_title('Episode Length Over Time', fontweight='bold')
-            self.ax2.legend(loc='best', fontsize=8)
-            self.ax2.grid(True, alpha=0.3)
-        else:
-            self.ax2.text(0.5, 0.5, 'Episode data not available', 
-                         ha='center', va='center')
+            self._bars = self.ax4.barh(names, values, color='steelblue')
+            self._bar_names = names
+            self._bar_labels = [
+                self.ax4.text(0, bar.get_y() + bar.get_height()/2, '',
+                              va='center', ha='left', fontsize=9)
+                for bar in self._bars
+            ]
         
-        # --- Plot 3: Loss Curves ---
-        self.ax3.clear()
+        for bar, label, val in zip(self._bars, self._bar_labels, values):
+            bar.set_width(val)
+            label.set_x(val)
+            label.set_text(f'{val:.3f}')
         
-        if 'loss' in metrics_df.columns:
-            for client_id in metrics_df['client_id'].unique():
-                client_data = metrics_df[metrics_df['client_id'] == client_id]
-                self.ax3.plot(client_data['round'], client_data['loss'], 
-                             label=f'Client {client_id}', alpha=0.6)
+        self.ax4.relim()
+        self.ax4.autoscale_view()
+    
+    def _clock_text(self):
+        """Wall-clock time as HH:MM:SS, formatted at most once per second"""
+        now = int(time.time())
+        if now != self._clock[0]:
+            self._clock = (now, time.strftime('%H:%M:%S', time.localtime(now)))
+        return self._clock[1]
+    
+    def take_snapshot(self):
+        """Read new rows from both CSVs and return a MetricsSnapshot"""
+        self.read_metrics()
+        latest_actions = self.read_actions()
+        
+        def views(store):
+            return {client_id: array.view() for client_id, array in store.items()}
+        
+        # Views stay valid: appends only write past their end or reallocate
+        return MetricsSnapshot(
+            generation=self._metrics_generation,
+            latest_round=self.latest_round,
+            actions=latest_actions,
+            client_rounds=views(self.client_rounds),
+            client_rewards=views(self.client_rewards),
+            client_eplen=views(self.client_eplen),
+            client_loss=views(self.client_loss),
+            rounds_all=self.rounds_all.view(),
+            global_reward_all=(None if self.global_reward_all is None
+                               else self.global_reward_all.view()),
+        )
+    
+    def _publish(self, snapshot):
+        """Hand a snapshot to the GUI thread, replacing any undrawn one"""
+        try:
+            self._snapshots.get_nowait()
+        except queue.Empty:
+            pass
+        self._snapshots.put_nowait(snapshot)
+    
+    def update_plot(self, snapshot):
+        """Update all plots from a MetricsSnapshot"""
+        if snapshot.generation != self._drawn_generation:
+            # Metrics file was rewritten - drop lines for the old data
+            self._drawn_generation = snapshot.generation
+            self._clear_lines()
+        
+        if not snapshot.client_rounds:
+            # No data yet - show waiting message
+            self._placeholders[self.ax1].set_visible(True)
+            return
+        self._placeholders[self.ax1].set_visible(False)
+        
+        # --- Plot 1: Reward Curves ---
+        new_line = False
+        for client_id, rounds in snapshot.client_rounds.items():
+            new_line |= self._set_series(
+                self.ax1, f'reward/{client_id}', rounds, snapshot.client_rewards[client_id],
+                marker='o', label=f'Client {client_id}', alpha=0.7)
+        
+        # Plot global average if available
+        if snapshot.global_reward_all is not None:
+            global_rounds, global_rewards = first_per_round(
+                snapshot.rounds_all, snapshot.global_reward_all)
+            new_line |= self._set_series(
+                self.ax1, 'global', global_rounds, global_rewards,
+                linestyle='--', linewidth=3, color='black',
+                marker='s', label='Global', alpha=0.9)
+        
+        if new_line:
+            self.ax1.legend(loc='best', fontsize=9)
+        self.ax1.relim()
+        self.ax1.autoscale_view()
+        
+        # --- Plot 2: Episode Lengths / Plot 3: Loss Curves ---
+        for ax, name, prefix, store in [
+            (self.ax2, 'episode_length', 'eplen', snapshot.client_eplen),
+            (self.ax3, 'loss', 'loss', snapshot.client_loss),
+        ]:
+            available = bool(store)
+            self._placeholders[ax].set_visible(not available)
+            if not available:
+                continue
             
-            self.ax3.set_xlabel('Round', fontweight='bold')
-            self.ax3.set_ylabel('Loss', fontweight='bold')
-            self.ax3.set_title('Training Loss', fontweight='bold')
-            self.ax3.legend(loc='best', fontsize=8)
-            self.ax3.grid(True, alpha=0.3)
-            self.ax3.set_yscale('log')  # Log scale for loss
-        else:
-            self.ax3.text(0.5, 0.5, 'Loss data not available', 
-                         ha='center', va='center')
+            new_line = False
+            for client_id, rounds in snapshot.client_rounds.items():
+                new_line |= self._set_series(
+                    ax, f'{prefix}/{client_id}', rounds, store[client_id],
+                    label=f'Client {client_id}', alpha=0.6)
+            
+            if new_line:
+                ax.legend(loc='best', fontsize=8)
+            ax.relim()
+            ax.autoscale_view()
         
         # --- Plot 4: Action Distribution ---
-        self.ax4.clear()
+        latest_actions = snapshot.actions
+        has_actions = latest_actions is not None
+        self._placeholders[self.ax4].set_visible(not has_actions)
         
-        if actions_df is not None and len(actions_df) > 0:
-            # Get latest action distribution
-            latest_actions = actions_df.iloc[-1]
-            action_names = [col for col in actions_df.columns if col not in ['round', 'client_id']]
+        if has_actions:
+            # Latest action distribution
+            action_names = [col for col in latest_actions.index
+                            if col not in ['timestamp', 'epoch_ts', 'round', 'client_id']]
             action_values = [latest_actions[name] for name in action_names]
-            
-            bars = self.ax4.barh(action_names, action_values, color='steelblue')
-            self.ax4.set_xlabel('Frequency', fontweight='bold')
-            self.ax4.set_title('Current Action Distribution', fontweight='bold')
-            self.ax4.grid(True, axis='x', alpha=0.3)
-            
-            # Add value labels
-            for bar, val in zip(bars, action_values):
-                self.ax4.text(val, bar.get_y() + bar.get_height()/2, 
-                             f'{val:.3f}', va='center', ha='left', fontsize=9)
-        else:
-            self.ax4.text(0.5, 0.5, 'Action data not available', 
-                         ha='center', va='center')
+            self._update_bars(action_names, action_values)
         
         # --- Plot 5: Training Statistics ---
-        self.ax5.clear()
-        self.ax5.axis('off')
         
-        # Calculate statistics
-        latest_round = metrics_df['round'].max()
-        n_clients = metrics_df['client_id'].nunique()
+        # Calculate statistics from the per-client arrays
+        latest_round = snapshot.latest_round
+        n_clients = len(snapshot.client_rounds)
         
-        latest_rewards = metrics_df[metrics_df['round'] == latest_round]['mean_reward']
-        avg_reward = latest_rewards.mean()
-        best_reward = latest_rewards.max()
-        worst_reward = latest_rewards.min()
+        latest_rewards = latest_round_values(
+            snapshot.client_rounds, snapshot.client_rewards, latest_round)
+        if latest_rewards.size:
+            avg_reward = latest_rewards.mean()
+            best_reward = latest_rewards.max()
+            worst_reward = latest_rewards.min()
+        else:
+            avg_reward = best_reward = worst_reward = np.nan
+        # Sample std like pandas' Series.std(); undefined for a single client
+        std_reward = latest_rewards.std(ddof=1) if latest_rewards.size > 1 else np.nan
         
         # Create statistics text
         stats_text = f"""
@@ -213,28 +730,85 @@ class DRLTrainingPlotter:
         • Average: {avg_reward:.4f}
         • Best Client: {best_reward:.4f}
         • Worst Client: {worst_reward:.4f}
-        • Std Dev: {latest_rewards.std():.4f}
+        • Std Dev: {std_reward:.4f}
         
         PROGRESS:
         • Total Timesteps: {latest_round * 5000 * n_clients:,}
-        • Elapsed Time: {datetime.now().strftime('%H:%M:%S')}
+        • Elapsed Time: {self._clock_text()}
         
         STATUS: 🟢 TRAINING IN PROGRESS
         """
         
-        self.ax5.text(0.1, 0.95, stats_text, transform=self.ax5.transAxes,
-                     fontsize=10, verticalalignment='top', 
-                     fontfamily='monospace',
-                     bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.3))
+        self._stats_text.set_text(stats_text)
+        self._stats_text.set_visible(True)
+    
+    @staticmethod
+    def _file_signature(path):
+        """Return (mtime, size) of path, or None if it does not exist"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+    
+    def _watch(self):
+        """
+        Background loop: when either CSV changes, parse the new rows here
+        and publish a snapshot, so parsing never blocks the GUI thread.
+        """
+        # Every file a source may switch to, so a newer .arrow is noticed
+        watched = (metrics_source_paths(self.metrics_file)
+                   + metrics_source_paths(self.actions_file))
+        last = None
+        last_error = None
+        while not self._stop.is_set():
+            signature = tuple(map(self._file_signature, watched))
+            if signature != last:
+                try:
+                    self._publish(self.take_snapshot())
+                except Exception as e:
+                    # Keep polling (and retrying) rather than let the thread
+                    # die and leave the figure stale; report each error once
+                    if repr(e) != last_error:
+                        last_error = repr(e)
+                        print(f"Warning: Error updating plot data: {e!r}")
+                else:
+                    last = signature
+                    last_error = None
+            self._stop.wait(REFRESH_INTERVAL / 1000)
+    
+    def _draw_latest_snapshot(self):
+        """
+        Timer callback on the GUI thread: draw the latest snapshot, if any.
         
-        plt.tight_layout()
+        Snapshots published between two ticks collapse into the newest one.
+        """
+        try:
+            snapshot = self._snapshots.get_nowait()
+        except queue.Empty:
+            return
+        self.update_plot(snapshot)
+        self.fig.canvas.draw_idle()
     
     def start(self):
         """Start the real-time plotting"""
-        ani = animation.FuncAnimation(self.fig, self.update_plot, 
-                                     interval=REFRESH_INTERVAL,
-                                     cache_frame_data=False)
-        plt.show()
+        self._stop = threading.Event()
+        
+        watcher = threading.Thread(target=self._watch, daemon=True)
+        watcher.start()
+        
+        # Matplotlib artists must only be touched from the GUI thread, so the
+        # watcher only reads data and this timer does the drawing
+        timer = self.fig.canvas.new_timer(interval=REFRESH_INTERVAL)
+        timer.add_callback(self._draw_latest_snapshot)
+        timer.start()
+        self.fig.canvas.mpl_connect('close_event', lambda event: self._stop.set())
+        
+        try:
+            plt.show()
+        finally:
+            self._stop.set()
+            timer.stop()
 
 
 def main():
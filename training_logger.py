@@ -14,12 +14,103 @@ Usage:
 """
 
 import os
-import csv
-import json
+import mmap
+import time
+import queue
+import array
+import struct
+import atexit
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-import numpy as np
+from typing import Dict, List, Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy
+
+
+# The writer thread writes a file's pending bytes once they exceed this
+# size, or as soon as it has caught up with the queue, so bursts are
+# batched and idle periods are not
+FLUSH_THRESHOLD = 128 * 1024
+
+# Columns of the numeric metrics array (timestamp as epoch seconds,
+# global_reward NaN when not given)
+METRICS_ARRAY_COLUMNS = (
+    'epoch_ts', 'round', 'client_id', 'mean_reward', 'std_reward',
+    'episode_length', 'loss', 'global_reward'
+)
+
+# CSV header lines. Timestamps are written as epoch seconds; ts_iso()
+# converts them for display.
+METRICS_HEADER = (
+    b'epoch_ts,round,client_id,mean_reward,'
+    b'std_reward,episode_length,loss,global_reward\r\n'
+)
+ACTIONS_HEADER = (
+    b'epoch_ts,round,client_id,'
+    b'skip_0,skip_1,skip_2,skip_3,skip_4,'
+    b'bitrate_low,bitrate_med,bitrate_high,bitrate_auto,'
+    b'prefetch_off,prefetch_short,prefetch_long\r\n'
+)
+
+# Action counts per row: skip×5, bitrate×4, prefetch×3 (the
+# MultiDiscrete([5, 4, 3]) action space flattened; ACTION_OFFSETS is
+# where each sub-action's block starts)
+ACTION_DIMS = (5, 4, 3)
+ACTION_OFFSETS = (0, 5, 9)
+N_ACTIONS = 12
+
+# Functions and classes of the liburing Python bindings used by the
+# optional io_uring path (the io_uring()/io_uring_cqe() object API, as in
+# the 2022-2025 releases). Releases without them, such as 2026.3.30,
+# fall back to os.write.
+LIBURING_API = (
+    'io_uring', 'io_uring_cqe', 'io_uring_queue_init', 'io_uring_queue_exit',
+    'io_uring_get_sqe', 'io_uring_prep_write', 'io_uring_sqe_set_data64',
+    'io_uring_submit', 'io_uring_wait_cqe', 'io_uring_cqe_seen'
+)
+
+# Record kinds; with binary_log=True each line is stored in training.binlog
+# as a (kind, payload length) header followed by the UTF-8 payload
+RECORD_METRICS, RECORD_ACTIONS, RECORD_EVENT = 0, 1, 2
+RECORD_HEADER = struct.Struct('<BI')
+# Byte offset of the binary log exported so far, kept in training.binlog.offset
+BINLOG_OFFSET = struct.Struct('<Q')
+
+
+def _open_csv(path: str, header: bytes) -> int:
+    """
+    Open a CSV for appending, writing the header if the file is new
+    
+    A non-empty file whose header differs (e.g. the ISO `timestamp`
+    column of older runs) is renamed to <name>.<mtime>.csv first, so one
+    column never mixes two formats.
+    
+    Returns:
+        Descriptor opened with O_WRONLY | O_APPEND
+    """
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+    fd = os.open(path, flags, 0o644)
+    st = os.fstat(fd)
+    if st.st_size:
+        with open(path, 'rb') as f:
+            first_line = f.readline()
+        if first_line.rstrip(b'\r\n') == header.rstrip(b'\r\n'):
+            return fd
+        os.close(fd)
+        root, ext = os.path.splitext(path)
+        stamp = time.strftime('%Y%m%d_%H%M%S', time.localtime(st.st_mtime))
+        os.replace(path, f"{root}.{stamp}{ext}")
+        fd = os.open(path, flags, 0o644)
+    os.write(fd, header)
+    return fd
+
+
+def _write_all(fd: int, buf: bytearray):
+    """os.write the whole buffer (retrying short writes) and empty it"""
+    while buf:
+        del buf[:os.write(fd, buf)]
 
 
 class TrainingLogger:
@@ -34,13 +125,21 @@ class TrainingLogger:
         - Real-time file writing for monitoring
     """
     
-    def __init__(self, output_dir: str = 'drl_outputs', experiment_name: Optional[str] = None):
+    def __init__(self, output_dir: str = 'drl_outputs', experiment_name: Optional[str] = None,
+                 use_io_uring: bool = False, binary_log: bool = False):
         """
         Initialize training logger
         
         Args:
             output_dir: Directory to save logs
             experiment_name: Name of experiment (default: timestamp)
+            use_io_uring: Submit each batch of file writes with a single
+                          io_uring call (needs liburing bindings providing
+                          LIBURING_API; falls back to os.write otherwise)
+            binary_log: Append all rows and events to one binary log
+                        (training.binlog) and materialize the CSVs and
+                        text log from it on flush()/save() instead of
+                        writing them live
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True, parents=True)
@@ -50,56 +149,88 @@ class TrainingLogger:
             experiment_name = datetime.now().strftime('%Y%m%d_%H%M%S')
         self.experiment_name = experiment_name
         
-        # Create log files
-        self.metrics_file = self.output_dir / 'metrics.csv'
-        self.actions_file = self.output_dir / 'actions.csv'
-        self.events_file = self.output_dir / 'training_log.txt'
-        self.config_file = self.output_dir / 'config.json'
+        # Create log files (plain str paths, passed straight to os.open)
+        out = str(self.output_dir)
+        self.metrics_file = os.path.join(out, 'metrics.csv')
+        self.actions_file = os.path.join(out, 'actions.csv')
+        self.events_file = os.path.join(out, 'training_log.txt')
+        self.config_file = os.path.join(out, 'config.json')
+        self.binlog_file = os.path.join(out, 'training.binlog')
+        self.binlog_offset_file = self.binlog_file + '.offset'
+        
+        # Persistent raw descriptors; lines are accumulated in bytearrays
+        # and written with os.write in batches, bypassing the text I/O stack.
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+        self._metrics_fd = _open_csv(self.metrics_file, METRICS_HEADER)
+        self._actions_fd = _open_csv(self.actions_file, ACTIONS_HEADER)
+        self._events_fd = os.open(self.events_file, flags, 0o644)
+        self._fds = (self._metrics_fd, self._actions_fd, self._events_fd)
         
-        # Initialize CSV files with headers
-        self._init_metrics_csv()
-        self._init_actions_csv()
+        # Optional single binary log. It is emptied on close(), so records
+        # still present come from a session that died first: export the
+        # part it had not exported yet before logging anything new
+        self._binlog_fd = None
+        if binary_log:
+            self._binlog_fd = os.open(self.binlog_file, flags, 0o644)
+            self._binlog_offset = self._load_binlog_offset()
+            self._export_lock = threading.Lock()
+            self._export_binlog()
+            self._reset_binlog()
         
-        # In-memory buffers
-        self.metrics_buffer = []
-        self.actions_buffer = []
-        self.events_buffer = []
+        if hasattr(os, 'posix_fadvise'):
+            # Append-only streams: let the kernel favour sequential write-behind
+            for fd in self._fds + (self._binlog_fd,):
+                if fd is not None:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        self._flush_threshold = FLUSH_THRESHOLD
+        
+        # Optional io_uring ring, used only by the writer thread
+        self._liburing = None
+        self._ring = None
+        if use_io_uring:
+            self._init_io_uring()
+        
+        # All file writes happen on a background thread; callers only enqueue
+        # (record kind, text) pairs so training never blocks on disk I/O
+        self._queue = queue.SimpleQueue()
+        self._writer_thread = threading.Thread(
+            target=self._drain, name='TrainingLoggerWriter', daemon=True
+        )
+        self._writer_error = None
+        self._writer_thread.start()
+        self._closed = False
+        self._ts_cache = (None, '')
+        atexit.register(self.close)
+        
+        # In-memory buffers. Numeric rows are packed into flat stdlib arrays
+        # (row-major, fixed width) so logging never needs numpy; it is
+        # imported only when a summary or readback is requested.
+        self._metrics_array = array.array('d')
+        self._metrics_len = 0
+        self._rounds_seen = set()
+        self._clients_seen = set()
+        # Action counts as int32 rows with parallel (round, client_id)
+        # and epoch-timestamp arrays instead of a list of mixed-type lists
+        self._actions_mat = array.array('i')
+        self._actions_meta = array.array('i')
+        self._actions_time = array.array('d')
+        self._actions_len = 0
         
         self._log_event("Logger initialized", level='INFO')
     
-    def _init_metrics_csv(self):
-        """Initialize metrics CSV file with headers"""
-        if not self.metrics_file.exists():
-            with open(self.metrics_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    'timestamp', 'round', 'client_id', 'mean_reward', 
-                    'std_reward', 'episode_length', 'loss', 'global_reward'
-                ])
-    
-    def _init_actions_csv(self):
-        """Initialize actions CSV file with headers"""
-        if not self.actions_file.exists():
-            with open(self.actions_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    'timestamp', 'round', 'client_id',
-                    'skip_0', 'skip_1', 'skip_2', 'skip_3', 'skip_4',
-                    'bitrate_low', 'bitrate_med', 'bitrate_high', 'bitrate_auto',
-                    'prefetch_off', 'prefetch_short', 'prefetch_long'
-                ])
+    def ts_iso(self, t: float) -> str:
+        """ISO timestamp (second resolution) for epoch time t, cached per second"""
+        sec = int(t)
+        if sec != self._ts_cache[0]:
+            self._ts_cache = (sec, time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(sec)))
+        return self._ts_cache[1]
     
     def _log_event(self, message: str, level: str = 'INFO'):
         """Log event to text file"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = self.ts_iso(time.time()).replace('T', ' ')
         log_line = f"[{timestamp}] [{level}] {message}\n"
         
-        # Write to file immediately
-        with open(self.events_file, 'a') as f:
-            f.write(log_line)
-        
-        # Also keep in buffer
-        self.events_buffer.append(log_line)
+        self._put((RECORD_EVENT, log_line))
     
     def log_config(self, config: Dict[str, Any]):
         """
@@ -111,6 +242,7 @@ class TrainingLogger:
         config['experiment_name'] = self.experiment_name
         config['timestamp'] = datetime.now().isoformat()
         
+        import json
         with open(self.config_file, 'w') as f:
             json.dump(config, f, indent=2, default=str)
         
@@ -131,27 +263,48 @@ class TrainingLogger:
             loss: Training loss
             global_reward: Global policy reward (if available)
         """
-        timestamp = datetime.now().isoformat()
+        timestamp = time.time()
         
-        row = [
-            timestamp, round_num, client_id, mean_reward,
-            std_reward, episode_length, loss,
-            global_reward if global_reward is not None else ''
-        ]
+        # Convert the whole row first so a bad value can't leave a partial row
+        row = array.array('d', (
+            timestamp, round_num, client_id, mean_reward, std_reward,
+            episode_length, loss,
+            global_reward if global_reward is not None else float('nan')
+        ))
+        self._metrics_array += row
+        self._metrics_len += 1
+        self._rounds_seen.add(round_num)
+        self._clients_seen.add(client_id)
+        
+        gr = global_reward if global_reward is not None else ''
         
-        # Write immediately to CSV
-        with open(self.metrics_file, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(row)
+        # Fixed numeric schema: nothing ever needs CSV quoting, so format
+        # the line directly (str() matches what csv.writer would emit)
+        self._put((RECORD_METRICS,
+            f"{timestamp:.6f},{round_num},{client_id},{mean_reward},{std_reward},"
+            f"{episode_length},{loss},{gr}\r\n"
+        ))
         
         # Log event
         self._log_event(
             f"Round {round_num} | Client {client_id} | Reward: {mean_reward:.4f} | Loss: {loss:.4f}",
             level='METRIC'
         )
-        
-        # Keep in buffer
-        self.metrics_buffer.append(row)
+    
+    @property
+    def metrics_buffer(self) -> List[list]:
+        """Logged metric rows as [epoch_ts, round, client_id, mean_reward,
+        std_reward, episode_length, loss, global_reward or '']"""
+        width = len(METRICS_ARRAY_COLUMNS)
+        arr = self._metrics_array
+        rows = []
+        for i in range(0, len(arr), width):
+            ts, r, c, mean, std, length, loss, gr = arr[i:i + width]
+            if length.is_integer():
+                length = int(length)
+            rows.append([ts, int(r), int(c), mean, std, length, loss,
+                         '' if gr != gr else gr])  # NaN -> no global reward
+        return rows
     
     def log_action_distribution(self, round_num: int, client_id: int,
                                 action_counts: List[int]):
@@ -161,23 +314,262 @@ class TrainingLogger:
         Args:
             round_num: Federated round number
             client_id: Client identifier
-            action_counts: List of action counts [skip×5, bitrate×4, prefetch×3]
-                          Should have length 12
+            action_counts: List or array of action counts
+                          [skip×5, bitrate×4, prefetch×3]; zero-padded
+                          (or truncated) to 12 values
         """
-        timestamp = datetime.now().isoformat()
+        timestamp = time.time()
         
-        # Ensure we have 12 values
-        if len(action_counts) != 12:
-            action_counts = action_counts + [0] * (12 - len(action_counts))
+        # Convert every piece before touching the stores so a bad value
+        # can't leave the count, meta and time arrays misaligned
+        if len(action_counts) == N_ACTIONS:
+            # Common case: one C-level conversion, no padding needed
+            counts = array.array('i', action_counts)
+        else:
+            counts = array.array('i', action_counts[:N_ACTIONS])
+            counts.extend([0] * (N_ACTIONS - len(counts)))
+        meta = array.array('i', (round_num, client_id))
         
-        row = [timestamp, round_num, client_id] + action_counts
+        self._actions_mat += counts
+        self._actions_meta += meta
+        self._actions_time.append(timestamp)
+        self._actions_len += 1
         
-        # Write immediately to CSV
-        with open(self.actions_file, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(row)
+        counts_csv = ','.join(map(str, counts))
+        self._put((RECORD_ACTIONS,
+                   f"{timestamp:.6f},{round_num},{client_id},{counts_csv}\r\n"))
+    
+    def log_action_stream(self, round_num: int, client_id: int, actions):
+        """
+        Count raw actions with np.bincount and log the distribution
         
-        self.actions_buffer.append(row)
+        Args:
+            round_num: Federated round number
+            client_id: Client identifier
+            actions: Integer array of actions taken, either shape (steps, 3)
+                     with one (skip, bitrate, prefetch) choice per step, or
+                     shape (n,) of flattened indices 0-11
+        
+        Raises:
+            ValueError: If the shape is not (n,) or (steps, 3), or an
+                        action is outside its range
+        """
+        import numpy as np
+        
+        actions = np.asarray(actions, dtype=np.intp)
+        if actions.ndim == 2 and actions.shape[1] == len(ACTION_DIMS):
+            bad = ((actions < 0) | (actions >= np.array(ACTION_DIMS))).any(axis=0)
+            if bad.any():
+                col = int(bad.argmax())
+                name = ('skip', 'bitrate', 'prefetch')[col]
+                raise ValueError(f"{name} actions must be in [0, {ACTION_DIMS[col]})")
+            # Shift each sub-action into its block of the 12 count columns
+            actions = actions + np.array(ACTION_OFFSETS, dtype=np.intp)
+        elif actions.ndim == 1:
+            if actions.size and (actions.min() < 0 or actions.max() >= N_ACTIONS):
+                raise ValueError(f"action indices must be in [0, {N_ACTIONS})")
+        else:
+            raise ValueError(
+                f"actions must have shape (n,) or (steps, {len(ACTION_DIMS)}), "
+                f"got {actions.shape}"
+            )
+        counts = np.bincount(actions.ravel(), minlength=N_ACTIONS)
+        self.log_action_distribution(round_num, client_id, counts.tolist())
+    
+    @property
+    def actions_buffer(self) -> List[list]:
+        """Logged action rows as [epoch_ts, round, client_id, *counts]"""
+        mat, meta = self._actions_mat, self._actions_meta
+        return [
+            [t, meta[2 * i], meta[2 * i + 1]] + mat[i * N_ACTIONS:(i + 1) * N_ACTIONS].tolist()
+            for i, t in enumerate(self._actions_time)
+        ]
+    
+    def _put(self, item):
+        """Hand a record to the writer thread"""
+        if self._closed:
+            raise ValueError("I/O operation on closed TrainingLogger")
+        self._queue.put(item)
+    
+    def _drain(self):
+        """Writer thread: write queued lines until the None sentinel arrives"""
+        binlog_fd = self._binlog_fd
+        if binlog_fd is None:
+            buffers = {fd: bytearray() for fd in self._fds}
+        else:
+            buffers = {binlog_fd: bytearray()}
+        
+        def write_all():
+            try:
+                if self._ring is not None:
+                    self._write_io_uring(buffers)
+                # Plain path, and the remainder of any short io_uring write
+                for fd, buf in buffers.items():
+                    _write_all(fd, buf)
+            except Exception as exc:
+                # Keep the thread alive: drop what could not be written and
+                # re-raise the error from the caller's next flush()/close()
+                self._writer_error = exc
+                for buf in buffers.values():
+                    buf.clear()
+        
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            if isinstance(item, threading.Event):
+                # flush() request: everything queued before it is written
+                write_all()
+                item.set()
+                continue
+            kind, text = item
+            data = text.encode('utf-8', 'replace')
+            if binlog_fd is None:
+                buf = buffers[self._fds[kind]]
+            else:
+                buf = buffers[binlog_fd]
+                buf += RECORD_HEADER.pack(kind, len(data))
+            buf += data
+            if len(buf) >= self._flush_threshold or self._queue.empty():
+                write_all()
+        write_all()
+    
+    def _init_io_uring(self):
+        """Set up the io_uring ring, leaving it None (os.write) when unsupported"""
+        try:
+            import liburing
+            for name in LIBURING_API:
+                getattr(liburing, name)
+            ring = liburing.io_uring()
+            liburing.io_uring_queue_init(8, ring, 0)
+        except (ImportError, AttributeError, OSError):
+            # Bindings missing or without this API, or no kernel support
+            return
+        self._liburing = liburing
+        self._ring = ring
+    
+    def _write_io_uring(self, buffers: Dict[int, bytearray]):
+        """Submit one write per non-empty buffer with a single io_uring_enter"""
+        lib = self._liburing
+        pending = [(fd, buf) for fd, buf in buffers.items() if buf]
+        if not pending:
+            return
+        for i, (fd, buf) in enumerate(pending):
+            sqe = lib.io_uring_get_sqe(self._ring)
+            # Descriptors are O_APPEND, so the offset is ignored
+            lib.io_uring_prep_write(sqe, fd, buf, len(buf), 0)
+            lib.io_uring_sqe_set_data64(sqe, i)
+        lib.io_uring_submit(self._ring)
+        
+        cqe = lib.io_uring_cqe()
+        written = [0] * len(pending)
+        for _ in pending:
+            lib.io_uring_wait_cqe(self._ring, cqe)
+            # A failed write (negative errno) leaves its buffer untouched;
+            # the caller's os.write pass retries it and raises if it fails
+            written[cqe.user_data] = max(cqe.res, 0)
+            lib.io_uring_cqe_seen(self._ring, cqe)
+        for (fd, buf), n in zip(pending, written):
+            del buf[:n]
+    
+    def _export_binlog(self):
+        """Append binary-log records written since the last export to the CSVs and text log"""
+        with self._export_lock:
+            with open(self.binlog_file, 'rb') as f:
+                f.seek(self._binlog_offset)
+                data = f.read()
+            
+            out = [bytearray() for _ in self._fds]
+            pos = 0
+            while pos + RECORD_HEADER.size <= len(data):
+                kind, size = RECORD_HEADER.unpack_from(data, pos)
+                end = pos + RECORD_HEADER.size + size
+                if end > len(data):
+                    break  # record still being written
+                out[kind] += data[pos + RECORD_HEADER.size:end]
+                pos = end
+            
+            for fd, buf in zip(self._fds, out):
+                _write_all(fd, buf)
+            if pos:
+                self._binlog_offset += pos
+                with open(self.binlog_offset_file, 'wb') as f:
+                    f.write(BINLOG_OFFSET.pack(self._binlog_offset))
+    
+    def _load_binlog_offset(self) -> int:
+        """Exported length of the binary log recorded by an earlier session"""
+        try:
+            with open(self.binlog_offset_file, 'rb') as f:
+                (offset,) = BINLOG_OFFSET.unpack(f.read(BINLOG_OFFSET.size))
+        except (OSError, struct.error):
+            return 0
+        # A log truncated after the offset was saved has nothing exported
+        return offset if offset <= os.fstat(self._binlog_fd).st_size else 0
+    
+    def _reset_binlog(self):
+        """Empty the binary log once everything in it is in the CSVs"""
+        os.ftruncate(self._binlog_fd, 0)
+        self._binlog_offset = 0
+        try:
+            os.remove(self.binlog_offset_file)
+        except FileNotFoundError:
+            pass
+    
+    def _check_writer(self):
+        """Re-raise a write error the writer thread hit since the last check"""
+        error, self._writer_error = self._writer_error, None
+        if error is not None:
+            raise error
+    
+    def flush(self):
+        """
+        Block until all queued rows and events are written to disk
+        
+        Raises:
+            OSError: If the writer thread failed to write queued data
+        """
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        while not done.wait(0.5):
+            if not self._writer_thread.is_alive():
+                self._check_writer()
+                raise RuntimeError("TrainingLogger writer thread has stopped")
+        self._check_writer()
+        if self._binlog_fd is not None:
+            self._export_binlog()
+    
+    def close(self):
+        """Stop the writer thread and close the log files (called at exit)"""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._queue.put(None)
+        self._writer_thread.join()
+        try:
+            if self._binlog_fd is not None:
+                self._export_binlog()
+                self._reset_binlog()
+        finally:
+            if self._ring is not None:
+                self._liburing.io_uring_queue_exit(self._ring)
+            for fd in self._fds + (self._binlog_fd,):
+                if fd is None:
+                    continue
+                try:
+                    os.close(fd)
+                except OSError as exc:
+                    if self._writer_error is None:
+                        self._writer_error = exc
+        self._check_writer()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def log_episode(self, round_num: int, client_id: int, episode_num: int,
                    total_reward: float, length: int):
@@ -227,6 +619,7 @@ class TrainingLogger:
             error_msg += f" | Exception: {str(exception)}"
         
         self._log_event(error_msg, level='ERROR')
+        self.flush()
     
     def log_checkpoint(self, round_num: int, checkpoint_path: str):
         """
@@ -241,6 +634,33 @@ class TrainingLogger:
             level='CHECKPOINT'
         )
     
+    def load_metrics_mmap(self) -> 'numpy.ndarray':
+        """
+        Read metrics.csv back through a memory map
+        
+        Pending rows are flushed first. The file is parsed line by line
+        from the mapping, so large files are not copied into a Python
+        buffer before parsing.
+        
+        Returns:
+            Array of shape (rows, 7) with columns round, client_id,
+            mean_reward, std_reward, episode_length, loss, global_reward
+            (NaN where no global reward was logged)
+        """
+        import numpy as np
+        
+        self.flush()
+        with open(self.metrics_file, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            mm.readline()  # header
+            if mm.tell() == mm.size():
+                return np.empty((0, len(METRICS_ARRAY_COLUMNS) - 1))
+            return np.genfromtxt(
+                iter(mm.readline, b''), delimiter=',',
+                usecols=range(1, len(METRICS_ARRAY_COLUMNS)),
+                dtype=np.float64, ndmin=2
+            )
+    
     def get_metrics_summary(self) -> Dict[str, Any]:
         """
         Get summary of logged metrics
@@ -248,20 +668,24 @@ class TrainingLogger:
         Returns:
             Dictionary with summary statistics
         """
-        if len(self.metrics_buffer) == 0:
+        if self._metrics_len == 0:
             return {'status': 'No metrics logged yet'}
         
-        # Extract rewards
-        rewards = [row[3] for row in self.metrics_buffer if isinstance(row[3], (int, float))]
+        import numpy as np
+        
+        # Copy the column with a stdlib slice (atomic under the GIL) rather
+        # than np.frombuffer: an exported buffer would make the += in
+        # log_round raise BufferError on another thread
+        rewards = np.array(self._metrics_array[3::len(METRICS_ARRAY_COLUMNS)])
         
         summary = {
-            'total_rounds': len(set(row[1] for row in self.metrics_buffer)),
-            'total_clients': len(set(row[2] for row in self.metrics_buffer)),
-            'total_metrics': len(self.metrics_buffer),
-            'avg_reward': np.mean(rewards) if rewards else 0,
-            'max_reward': np.max(rewards) if rewards else 0,
-            'min_reward': np.min(rewards) if rewards else 0,
-            'std_reward': np.std(rewards) if rewards else 0,
+            'total_rounds': len(self._rounds_seen),
+            'total_clients': len(self._clients_seen),
+            'total_metrics': self._metrics_len,
+            'avg_reward': rewards.mean(),
+            'max_reward': rewards.max(),
+            'min_reward': rewards.min(),
+            'std_reward': rewards.std(),
         }
         
         return summary
@@ -278,30 +702,46 @@ class TrainingLogger:
         print("="*60 + "\n")
     
     def save(self):
-        """Force save all buffers (files are already written in real-time)"""
+        """
+        Write all buffers to disk, print the summary and close the log files
+        
+        The logger cannot log after save(); use it as a context manager or
+        call close() to finish without printing a summary. Calling save()
+        again afterwards does nothing.
+        """
+        if self._closed:
+            return
         self._log_event("Training session completed", level='INFO')
+        self.flush()
         self.print_summary()
+        self.close()
         print(f"✓ Logs saved to: {self.output_dir}")
 
 
 # Convenience functions
 def create_logger(output_dir: str = 'drl_outputs', 
-                 experiment_name: Optional[str] = None) -> TrainingLogger:
+                 experiment_name: Optional[str] = None,
+                 use_io_uring: bool = False,
+                 binary_log: bool = False) -> TrainingLogger:
     """
     Create and return a training logger
     
     Args:
         output_dir: Directory for logs
         experiment_name: Name of experiment
+        use_io_uring: Batch file writes through io_uring when available
+        binary_log: Write one binary log and export the CSVs on flush/save
     
     Returns:
         TrainingLogger instance
     """
-    return TrainingLogger(output_dir, experiment_name)
+    return TrainingLogger(output_dir, experiment_name, use_io_uring, binary_log)
 
 
 # Example usage
 if __name__ == '__main__':
+    import numpy as np
+    
     # Test the logger
     logger = TrainingLogger('test_outputs', 'test_experiment')
     